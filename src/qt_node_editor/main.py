@@ -1,30 +1,53 @@
 import argparse
-import configparser
+import functools
 import logging
 import os
 import sys
+import tomllib
 
-from qtpy.QtWidgets import QApplication
 
-from qt_node_editor.node_editor_window import NodeEditorWindow
+@functools.lru_cache(maxsize=1)
+def configure_logging(debug: bool):
+    "Set up logging format and per-module levels (once)."
+    log_level = "DEBUG" if debug else "INFO"
+    # Force debug loggging level when run in VS Code debug mode
+    if "PYDEVD_USE_FRAME_EVAL" in os.environ:
+        log_level = "DEBUG"
+    log_format = "[%(filename)s:%(lineno)s %(funcName)s] %(message)s"
+    logging.basicConfig(format=log_format, level=log_level)
 
-if __name__ == '__main__':
+    config_path = 'conf/logging_config.toml'
+    try:
+        with open(config_path, 'rb') as f:
+            config = tomllib.load(f)
+    except FileNotFoundError:
+        config = {}
+    except tomllib.TOMLDecodeError as e:
+        # e.g. a local copy of the old INI-style template
+        logging.getLogger(__name__).warning(
+            "Ignoring invalid logging config %s: %s", config_path, e)
+        config = {}
+    for logger_name, level in config.get("levels", {}).items():
+        if isinstance(level, str):
+            level = level.upper()  # numeric levels are used as is
+        logging.getLogger(logger_name).setLevel(level)
+
+
+def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--debug', action='store_true')
     args = parser.parse_args()
+    configure_logging(args.debug)
 
-    LOG_LEVEL = "DEBUG" if args.debug else "INFO"
-    # Force debug loggging level when run in VS Code debug mode
-    if "PYDEVD_USE_FRAME_EVAL" in os.environ:
-        LOG_LEVEL = "DEBUG"
-    FORMAT = "[%(filename)s:%(lineno)s %(funcName)s] %(message)s"
-    logging.basicConfig(format=FORMAT, level=LOG_LEVEL)
+    # Qt is imported after arguments are parsed, so `--help` does not load it
+    from qtpy.QtWidgets import QApplication
 
-    config = configparser.ConfigParser()
-    if config.read('conf/logging_config.toml'):
-        for logger_name, level in config["levels"].items():
-            logging.getLogger(logger_name).setLevel(level.upper())
+    from qt_node_editor.node_editor_window import NodeEditorWindow
 
     app = QApplication(sys.argv)
     wnd = NodeEditorWindow()
     sys.exit(app.exec())
+
+
+if __name__ == '__main__':
+    main()
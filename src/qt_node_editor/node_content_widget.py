@@ -4,6 +4,7 @@ Content of a node (widgets)
 import logging
 from typing import TYPE_CHECKING, TypedDict, cast
 
+from qtpy.QtCore import QMargins
 from qtpy.QtGui import QFocusEvent
 from qtpy.QtWidgets import QLabel, QTextEdit, QVBoxLayout, QWidget
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+ZERO_MARGINS = QMargins(0, 0, 0, 0)
+
 class ContentSerialize(TypedDict):
     pass
 
@@ -23,38 +26,45 @@ class QDMContentWidget(QWidget, Serializable):
     def __init__(self, node: "Node", parent: QWidget | None = None):
         self.node = node
         super().__init__(parent)
+        self._view: "QDMGraphicsView | None" = None  # see set_editing_flag
 
         self.init_ui()
 
     def init_ui(self):
         self._layout = QVBoxLayout()
-        self._layout.setContentsMargins(0, 0, 0, 0)  # no space around contents
+        self._layout.setContentsMargins(ZERO_MARGINS)  # no space around contents
         self.setLayout(self._layout)
 
         self.wdg_label = QLabel("Some Title")
         self._layout.addWidget(self.wdg_label)
-        self._layout.addWidget(QDMTextEdit("foo"))
+        self._layout.addWidget(QDMTextEdit("foo", self))
 
     def set_editing_flag(self, value: bool):
-        # FIXME: flag is set on the 1st view
-        view = cast("QDMGraphicsView", self.node.scene.gr_scene.views()[0])
-        view.editing_flag = value
+        if self._view is None:  # look up the view once
+            # FIXME: flag is set on the 1st view
+            self._view = cast("QDMGraphicsView",
+                              self.node.scene.gr_scene.views()[0])
+        self._view.editing_flag = value
 
     def serialize(self) -> ContentSerialize:
         return {
 
         }
 
-    def deserialize(self, data: ContentSerialize, hashmap: dict = {}):
+    def deserialize(self, data: ContentSerialize, hashmap: dict | None = None):
         return False
 
 
 class QDMTextEdit(QTextEdit):
+    def __init__(self, text: str, content: QDMContentWidget):
+        super().__init__(text, content)
+        self._content = content  # parent widget
+
     # FIXME: do not set editing flag from within text box (?)
     def focusInEvent(self, e: QFocusEvent) -> None:
-        cast(QDMContentWidget, self.parentWidget()).set_editing_flag(True)
+        self._content.set_editing_flag(True)
         return super().focusInEvent(e)
 
     def focusOutEvent(self, e: QFocusEvent | None) -> None:
-        cast(QDMContentWidget, self.parentWidget()).set_editing_flag(False)
+        self._content.set_editing_flag(False)
         return super().focusOutEvent(e)
@@ -5,13 +5,14 @@ import logging
 from enum import Enum, auto
 from typing import TYPE_CHECKING, TypedDict
 
-from qt_node_editor.node_graphics_edge import (QDMGraphicsEdgeBezier,
+from qt_node_editor.node_graphics_edge import (QDMGraphicsEdge,
+                                               QDMGraphicsEdgeBezier,
                                                QDMGraphicsEdgeDirect)
 from qt_node_editor.node_serializable import Serializable
-from qt_node_editor.node_socket import Socket
 
 if TYPE_CHECKING:
     from qt_node_editor.node_scene import Scene
+    from qt_node_editor.node_socket import Socket
 
 
 class EdgeType(int, Enum):
@@ -19,6 +20,11 @@ class EdgeType(int, Enum):
     DIRECT = auto()
     BEZIER = auto()
 
+EDGE_GRAPHICS_CLASSES: dict[EdgeType, type[QDMGraphicsEdge]] = {
+    EdgeType.DIRECT: QDMGraphicsEdgeDirect,
+    EdgeType.BEZIER: QDMGraphicsEdgeBezier,
+}
+
 class EdgeSerialize(TypedDict):
     id: int
     edge_type: EdgeType
@@ -29,10 +35,16 @@ log = logging.getLogger(__name__)
 
 
 class Edge(Serializable):
-    def __init__(self, scene: "Scene", start_socket: Socket | None=None,
-                 end_socket: Socket | None = None, shape=EdgeType.DIRECT) -> None:
+    __slots__ = ("id", "scene", "_start_socket", "_end_socket", "_edge_type",
+                 "gr_edge", "_loading", "_serialize_cache")
+
+    def __init__(self, scene: "Scene", start_socket: "Socket | None" = None,
+                 end_socket: "Socket | None" = None, shape=EdgeType.DIRECT) -> None:
         super().__init__()
         self.scene = scene
+        self.gr_edge: QDMGraphicsEdge | None = None
+        self._loading = False  # postpone update_positions in deserialize
+        self._serialize_cache: EdgeSerialize | None = None  # see serialize
         self.start_socket = start_socket
         self.end_socket = end_socket
         self.edge_type = shape
@@ -40,28 +52,33 @@ class Edge(Serializable):
         self.scene.add_edge(self)
 
     def __str__(self):
-        start_sock = hex(id(self.start_socket))[-3:] if self.start_socket else None
-        end_sock = hex(id(self.end_socket))[-3:] if self.end_socket else None
-        return (f"<Edge ..{hex(id(self))[-5:]} "
+        # last hex digits of ids are formatted without hex() and slicing
+        start_sock = f"{id(self.start_socket) & 0xFFF:03x}" \
+            if self.start_socket else None
+        end_sock = f"{id(self.end_socket) & 0xFFF:03x}" \
+            if self.end_socket else None
+        return (f"<Edge ..{id(self) & 0xFFFFF:05x} "
                 f"(sockets {start_sock} <--> {end_sock})>")
 
     @property
-    def start_socket(self) -> Socket | None:
+    def start_socket(self) -> "Socket | None":
         return self._start_socket
 
     @start_socket.setter
     def start_socket(self, value):
         self._start_socket = value
+        self._serialize_cache = None
         if self.start_socket is not None:
             self.start_socket.edge = self
 
     @property
-    def end_socket(self) -> Socket | None:
+    def end_socket(self) -> "Socket | None":
         return self._end_socket
 
     @end_socket.setter
     def end_socket(self, value):
         self._end_socket = value
+        self._serialize_cache = None
         if self.end_socket is not None:
             self.end_socket.edge = self
 
@@ -71,76 +88,82 @@ class Edge(Serializable):
 
     @edge_type.setter
     def edge_type(self, value: EdgeType):
-        if hasattr(self, "gr_edge") and self.gr_edge is not None:
+        if self.gr_edge is not None and self.edge_type == value:
+            return  # keep graphics item of the same type
+        try:
+            gr_edge_class = EDGE_GRAPHICS_CLASSES[value]
+        except KeyError:
+            raise ValueError(f"Unknown edge type: {value}") from None
+        if self.gr_edge is not None:
             self.scene.gr_scene.removeItem(self.gr_edge)
 
         self._edge_type = value
-        if self._edge_type == EdgeType.DIRECT:
-            self.gr_edge = QDMGraphicsEdgeDirect(self)
-        elif self._edge_type == EdgeType.BEZIER:
-            self.gr_edge = QDMGraphicsEdgeBezier(self)
-        else:
-            raise ValueError(f"Unknown edge type: {value}")
-
+        self._serialize_cache = None
+        self.gr_edge = gr_edge_class(self)
         self.scene.gr_scene.addItem(self.gr_edge)
         if self.start_socket is not None:
             self.update_positions()
 
     def update_positions(self):
         "Update start and end points of the edge on a scene"
+        if self._loading:
+            return
         if not self.start_socket or not self.gr_edge:
             # @Winand
             # disconnect_from_sockets sets start_socket to None
             # remove sets gr_edge to None
             raise ValueError(f"{self.start_socket=} {self.gr_edge=}")
-        source_pos = self.start_socket.get_socket_position()
-        source_pos[0] += self.start_socket.node.gr_node.pos().x()
-        source_pos[1] += self.start_socket.node.gr_node.pos().y()
-        self.gr_edge.set_source(*source_pos)
+        if not self.gr_edge.isVisible():
+            return  # updated by QDMGraphicsEdge when shown
+        sx, sy = self.start_socket.abs_pos
         if self.end_socket is not None:
-            end_pos = self.end_socket.get_socket_position()
-            end_pos[0] += self.end_socket.node.gr_node.pos().x()
-            end_pos[1] += self.end_socket.node.gr_node.pos().y()
-            self.gr_edge.set_destination(*end_pos)
+            ex, ey = self.end_socket.abs_pos
         else:  # dragging mode
-            self.gr_edge.set_destination(*source_pos)
-        self.gr_edge.update()
+            ex, ey = sx, sy
+        self.gr_edge.set_endpoints(sx, sy, ex, ey)
 
     def disconnect_from_sockets(self):
-        if self.start_socket is not None:
-            self.start_socket.edge = None
-        if self.end_socket is not None:
-            self.end_socket.edge = None
-        self.end_socket = None
-        self.start_socket = None
+        start, end = self._start_socket, self._end_socket
+        if start is not None:
+            start.edge = None
+        if end is not None:
+            end.edge = None
+        self._start_socket = self._end_socket = None
+        self._serialize_cache = None
 
     def remove(self):
         log.debug("# Removing Edge %s", self)
-        log.debug(" - remove edge from all sockets")
         self.disconnect_from_sockets()
-        log.debug(" - remove gr_edge")
         self.scene.gr_scene.removeItem(self.gr_edge)  # TODO: move to Scene.remove_edge?
         self.gr_edge = None
-        log.debug(" - remove edge from scene")
-        try:
-            self.scene.remove_edge(self)
-        except ValueError:
-            pass  # FIXME: eliminate exception handling here
-        log.debug(" - everything is done.")
+        self.scene.remove_edge(self)
 
     def serialize(self) -> EdgeSerialize:
-        return {
-            "id": self.id,
-            "edge_type": self.edge_type,
-            "start": self.start_socket.id if self.start_socket else None,
-            "end": self.end_socket.id if self.end_socket else None
-        }
-
-    def deserialize(self, data: EdgeSerialize, hashmap: dict = {},
+        "Serialize the edge. Result is cached until sockets, type or id change."
+        cache = self._serialize_cache
+        if cache is None or cache["id"] != self.id:
+            start, end = self._start_socket, self._end_socket
+            cache = self._serialize_cache = {
+                "id": self.id,
+                "edge_type": self._edge_type,
+                "start": start.id if start else None,
+                "end": end.id if end else None
+            }
+        return cache.copy()  # callers may modify the result
+
+    def deserialize(self, data: EdgeSerialize, hashmap: dict | None = None,
                     restore_id=True):
+        if hashmap is None:
+            raise ValueError("Edge.deserialize requires a hashmap to look up "
+                             "sockets by id")
         if restore_id:
             self.id = data["id"]
-        self.start_socket = hashmap[data["start"]]
-        self.end_socket = hashmap[data["end"]]
-        self.edge_type = data["edge_type"]
+        self._loading = True
+        try:
+            self.start_socket = hashmap[data["start"]]
+            self.end_socket = hashmap[data["end"]]
+            self.edge_type = data["edge_type"]
+        finally:
+            self._loading = False
+        self.update_positions()
         return True
@@ -1,3 +1,4 @@
+import functools
 import logging
 import pkgutil
 from typing import cast
@@ -45,20 +46,21 @@ class NodeEditorWidget(QWidget):
         # self.add_debug_content()
 
     def add_nodes(self):
-        node1 = Node(self.scene, "My Awesome Node 1",
-                    inputs=[0, 0, 0], outputs=[1])
-        node2 = Node(self.scene, "My Awesome Node 2",
-                    inputs=[3, 3, 3], outputs=[1])
-        node3 = Node(self.scene, "My Awesome Node 3",
-                    inputs=[2, 2, 2], outputs=[1])
-        node1.set_pos(-350, -250)
-        node2.set_pos(-75, 0)
-        node3.set_pos(200, -150)
-
-        edge1 = Edge(self.scene, node1.outputs[0], node2.inputs[0],
-                     shape=EdgeType.BEZIER)
-        edge2 = Edge(self.scene, node2.outputs[0], node3.inputs[0],
-                     shape=EdgeType.BEZIER)
+        with self.scene.bulk_update():
+            node1 = Node(self.scene, "My Awesome Node 1",
+                        inputs=[0, 0, 0], outputs=[1])
+            node2 = Node(self.scene, "My Awesome Node 2",
+                        inputs=[3, 3, 3], outputs=[1])
+            node3 = Node(self.scene, "My Awesome Node 3",
+                        inputs=[2, 2, 2], outputs=[1])
+            node1.set_pos(-350, -250)
+            node2.set_pos(-75, 0)
+            node3.set_pos(200, -150)
+
+            edge1 = Edge(self.scene, node1.outputs[0], node2.inputs[0],
+                         shape=EdgeType.BEZIER)
+            edge2 = Edge(self.scene, node2.outputs[0], node3.inputs[0],
+                         shape=EdgeType.BEZIER)
 
     def add_debug_content(self):
         green_brush = QBrush(Qt.GlobalColor.green)  # see also QtGui.QColorConstants
@@ -92,8 +94,16 @@ class NodeEditorWidget(QWidget):
 
     def loadStylesheet(self, filename: str):
         log.info("Style loading: %s", filename)
-        # Load file from package https://stackoverflow.com/a/58941536
-        if (stylesheet := pkgutil.get_data(__name__, filename)) is None:
-            raise FileNotFoundError(f"Cannot load {filename}")
-        cast(QApplication, QApplication.instance()) \
-            .setStyleSheet(stylesheet.decode())
+        stylesheet = read_stylesheet(filename)
+        app = cast(QApplication, QApplication.instance())
+        if app.styleSheet() != stylesheet:  # skip reparsing the same style
+            app.setStyleSheet(stylesheet)
+
+
+@functools.cache
+def read_stylesheet(filename: str) -> str:
+    "Read stylesheet text from package once."
+    # Load file from package https://stackoverflow.com/a/58941536
+    if (stylesheet := pkgutil.get_data(__name__, filename)) is None:
+        raise FileNotFoundError(f"Cannot load {filename}")
+    return stylesheet.decode()
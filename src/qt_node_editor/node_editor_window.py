@@ -1,22 +1,54 @@
+import importlib.util
 import json
 import logging
 from pathlib import Path
 
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtGui import QAction, QGuiApplication
-from qtpy.QtWidgets import QApplication, QFileDialog, QLabel, QMainWindow
+from qtpy.QtWidgets import (QApplication, QFileDialog, QLabel, QMainWindow,
+                            QMessageBox)
 
 from qt_node_editor.node_editor_widget import NodeEditorWidget
-from qt_node_editor.node_graphics_view import QDMGraphicsView
-from qt_node_editor.node_scene import SceneSerialize
+from qt_node_editor.node_scene import MSGPACK_SUFFIX, SceneSerialize
 from qt_node_editor.utils import As, some, validate_dict
 
+try:
+    import orjson  # optional dependency, faster clipboard (de)serialization
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 log = logging.getLogger(__name__)
 
+# MessagePack is an optional dependency, see `msgpack` extra
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+JSON_SUFFIX = ".json"
+JSON_FILTER = "JSON files (*.json)"
+MSGPACK_FILTER = "MessagePack files (*.msgpack)"
+# offer MessagePack only if it can be saved and loaded
+FILE_FILTER = f"{JSON_FILTER};;{MSGPACK_FILTER}" if HAS_MSGPACK else JSON_FILTER
+SCENE_POS_FORMAT = "Scene Pos: %d, %d"
+
+
+def dumps_clipboard(data) -> str:
+    "Serialize clipboard data to JSON text."
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=4)
+
+
+def loads_clipboard(text: str):
+    "Parse JSON text from clipboard. Raises ValueError if it is not valid."
+    if HAS_ORJSON:
+        return orjson.loads(text)  # orjson.JSONDecodeError is a ValueError
+    return json.loads(text)
+
 
 class NodeEditorWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.app = QApplication.instance() @As(QGuiApplication)
+        self.clipboard = some(self.app.clipboard())
         self.init_ui()
         self.filename = None
 
@@ -24,10 +56,15 @@ class NodeEditorWindow(QMainWindow):
         act = QAction(name, self)
         act.setShortcut(shortcut)
         act.setToolTip(tooltip)
-        act.triggered.connect(callback)
+        act.triggered.connect(callback, Qt.ConnectionType.UniqueConnection)
         return act
 
     def init_ui(self):
+        nodeeditor = NodeEditorWidget(self)
+        self.setCentralWidget(nodeeditor)
+        # scene and view live as long as the editor, connect actions directly
+        history = nodeeditor.scene.history
+
         menu_bar = some(self.menuBar())
 
         file_menu = some(menu_bar.addMenu('&File'))
@@ -51,10 +88,10 @@ class NodeEditorWindow(QMainWindow):
 
         edit_menu = some(menu_bar.addMenu("&Edit"))
         edit_menu.addAction(self.create_act(
-            '&Undo', 'Ctrl+Z', "Undo last operation", self.on_edit_undo
+            '&Undo', 'Ctrl+Z', "Undo last operation", history.undo
         ))
         edit_menu.addAction(self.create_act(
-            '&Redo', 'Ctrl+Y', "Redo last operation", self.on_edit_redo
+            '&Redo', 'Ctrl+Y', "Redo last operation", history.redo
         ))
         edit_menu.addSeparator()
         edit_menu.addAction(self.create_act(
@@ -68,15 +105,22 @@ class NodeEditorWindow(QMainWindow):
         ))
         edit_menu.addSeparator()
         edit_menu.addAction(self.create_act(
-            '&Delete', 'Del', "Delete selected items", self.on_edit_delete
+            '&Delete', 'Del', "Delete selected items",
+            nodeeditor.view.delete_selected
         ))
 
-        nodeeditor = NodeEditorWidget(self)
-        self.setCentralWidget(nodeeditor)
-
+        self.status_bar = some(self.statusBar())
         self.status_mouse_pos = QLabel("")
-        some(self.statusBar()).addPermanentWidget(self.status_mouse_pos)
-        nodeeditor.view.scene_pos_changed.connect(self.on_scene_pos_changed)
+        self.status_bar.addPermanentWidget(self.status_mouse_pos)
+        # label is updated at most once per frame (~16 ms) on mouse move
+        self.scene_pos = (0, 0)
+        self.scene_pos_timer = QTimer(self)
+        self.scene_pos_timer.setSingleShot(True)
+        self.scene_pos_timer.setInterval(16)
+        self.scene_pos_timer.timeout.connect(self.update_scene_pos_label)
+        nodeeditor.view.scene_pos_changed.connect(
+            self.on_scene_pos_changed, Qt.ConnectionType.UniqueConnection
+        )
 
         # Set window properties
         self.setGeometry(200, 200, 800, 600)
@@ -89,58 +133,67 @@ class NodeEditorWindow(QMainWindow):
         return super().centralWidget() @As(NodeEditorWidget)
 
     def on_scene_pos_changed(self, x: int, y: int):
-        self.status_mouse_pos.setText(f"Scene Pos: {x}, {y}")
+        self.scene_pos = x, y
+        if not self.scene_pos_timer.isActive():
+            self.scene_pos_timer.start()
+
+    def update_scene_pos_label(self):
+        self.status_mouse_pos.setText(SCENE_POS_FORMAT % self.scene_pos)
 
     def on_file_new(self):
         self.centralWidget().scene.clear()
 
     def on_file_open(self):
         fname, _ = QFileDialog.getOpenFileName(self, 'Open graph from file',
-                                               filter="JSON files (*.json)")
+                                               filter=FILE_FILTER)
         if fname == '':
             return
         if Path(fname).is_file():
-            self.centralWidget().scene.load_from_file(fname)
+            try:
+                self.centralWidget().scene.load_from_file(fname)
+            except ImportError as e:  # optional format support is missing
+                QMessageBox.warning(self, "Open file",
+                                    f"Cannot open {fname}:\n{e}")
 
     def on_file_save(self):
         if self.filename is None:
             return self.on_file_save_as()
-        self.centralWidget().scene.save_to_file(self.filename)
-        some(self.statusBar()).showMessage(f"Successfully saved {self.filename}")
+        try:
+            self.centralWidget().scene.save_to_file(self.filename)
+        except ImportError as e:  # optional format support is missing
+            QMessageBox.warning(self, "Save file",
+                                f"Cannot save {self.filename}:\n{e}")
+            self.filename = None  # nothing was saved, ask for a name again
+            return
+        self.status_bar.showMessage(f"Successfully saved {self.filename}")
 
     def on_file_save_as(self):
-        fname, _ = QFileDialog.getSaveFileName(self, 'Save graph to file',
-                                               filter="JSON files (*.json)")
+        fname, selected_filter = QFileDialog.getSaveFileName(
+            self, 'Save graph to file', filter=FILE_FILTER
+        )
         if fname == '':
             return
+        if not Path(fname).suffix:  # file format is chosen by suffix
+            fname += MSGPACK_SUFFIX if selected_filter == MSGPACK_FILTER \
+                else JSON_SUFFIX
         self.filename = fname
         self.on_file_save()
 
-    def on_edit_undo(self):
-        self.centralWidget().scene.history.undo()
-
-    def on_edit_redo(self):
-        self.centralWidget().scene.history.redo()
-
-    def on_edit_delete(self):
-        view = self.centralWidget().scene.gr_scene.views()[0] @As(QDMGraphicsView)
-        view.delete_selected()
-
     def on_edit_cut(self):
         data = self.centralWidget().scene.clipboard.serialize_selected(delete=True)
-        str_data = json.dumps(data, indent=4)
-        some(self.app.clipboard()).setText(str_data)
+        str_data = dumps_clipboard(data)
+        self.clipboard.setText(str_data)
 
     def on_edit_copy(self):
         data = self.centralWidget().scene.clipboard.serialize_selected(delete=False)
-        str_data = json.dumps(data, indent=4)
-        some(self.app.clipboard()).setText(str_data)
+        str_data = dumps_clipboard(data)
+        self.clipboard.setText(str_data)
 
     def on_edit_paste(self):
-        raw_data = some(self.app.clipboard()).text()
+        raw_data = self.clipboard.text()
 
         try:
-            json_data = json.loads(raw_data)
+            json_data = loads_clipboard(raw_data)
         except ValueError as e:
             log.error("Pasting of not valid json data! %s", e)
             return
@@ -16,8 +16,21 @@ class QDMCutLine(QGraphicsItem):
 
         self.setZValue(2)
 
+    def add_point(self, point: QPointF):
+        "Append a point to the line."
+        self.prepareGeometryChange()
+        self.line_points.append(point)
+
+    def clear_points(self):
+        "Remove all points of the line."
+        self.prepareGeometryChange()
+        self.line_points = []
+
     def boundingRect(self) -> QRectF:
-        return QRectF(0, 0, 1, 1)
+        "Area covered by the line (required for correct updates)"
+        margin = self._pen.widthF()
+        return QPolygonF(self.line_points).boundingRect() \
+            .adjusted(-margin, -margin, margin, margin)
     
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem | None, widget: QWidget | None = None) -> None:
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -1,7 +1,7 @@
 import math
 from typing import TYPE_CHECKING
 
-from qtpy.QtCore import QPointF, QRectF, Qt
+from qtpy.QtCore import QPointF, Qt
 from qtpy.QtGui import QColor, QPainter, QPainterPath, QPen
 from qtpy.QtWidgets import (QGraphicsItem, QGraphicsPathItem,
                             QStyleOptionGraphicsItem, QWidget)
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from qt_node_editor.node_edge import Edge
 
 GraphicsItemFlag = QGraphicsItem.GraphicsItemFlag
+GraphicsItemChange = QGraphicsItem.GraphicsItemChange
 
 EDGE_CP_ROUNDNESS = 100
 
@@ -29,6 +30,7 @@ class QDMGraphicsEdge(QGraphicsPathItem):
         self._pen.setWidthF(2.0)
         self._pen_selected.setWidthF(2.0)
         self._pen_dragging.setWidthF(2.0)
+        self.setPen(self._pen)  # pen width is used to calculate bounding rect
 
         self.setFlag(GraphicsItemFlag.ItemIsSelectable)
 
@@ -39,13 +41,26 @@ class QDMGraphicsEdge(QGraphicsPathItem):
 
     def set_source(self, x, y):
         self.pos_source = [x, y]
+        self.setPath(self.calc_path())
 
     def set_destination(self, x, y):
         self.pos_destination = [x, y]
+        self.setPath(self.calc_path())
+
+    def set_endpoints(self, source_x, source_y, dest_x, dest_y):
+        "Set source and destination points, rebuild the path once."
+        self.pos_source = [source_x, source_y]
+        self.pos_destination = [dest_x, dest_y]
+        self.setPath(self.calc_path())
+
+    def itemChange(self, change: GraphicsItemChange, value):
+        if change == GraphicsItemChange.ItemVisibleHasChanged and value and \
+                self.edge.start_socket is not None:
+            self.edge.update_positions()  # hidden edges are not updated
+        return super().itemChange(change, value)
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem | None,
               widget: QWidget | None = None) -> None:
-        self.setPath(self.calc_path())
         if self.edge.end_socket is None:
             painter.setPen(self._pen_dragging)
         else:
@@ -56,19 +71,12 @@ class QDMGraphicsEdge(QGraphicsPathItem):
     def intersects_with(self, p1: QPointF, p2: QPointF):
         cutpath = QPainterPath(p1)
         cutpath.lineTo(p2)
-        path = self.calc_path()
-        return cutpath.intersects(path)
+        return cutpath.intersects(self.path())
 
     def calc_path(self):
         "Handles drawing QPainterPath from point A to B"
         raise NotImplementedError("This method has to be overridden in a child class")
 
-    def boundingRect(self):
-        "Returns item area (required for correct updates)"
-        return QRectF(
-            QPointF(*self.pos_source), QPointF(*self.pos_destination)
-        ).normalized()
-
 
 class QDMGraphicsEdgeDirect(QDMGraphicsEdge):
     def calc_path(self):
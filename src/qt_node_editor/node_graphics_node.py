@@ -11,9 +11,12 @@ from qtpy.QtWidgets import (QGraphicsItem, QGraphicsProxyWidget, QGraphicsSceneM
                             QWidget)
 
 if TYPE_CHECKING:
+    from qt_node_editor.node_edge import Edge
     from qt_node_editor.node_node import Node
 
 GraphicsItemFlag = QGraphicsItem.GraphicsItemFlag
+GraphicsItemChange = QGraphicsItem.GraphicsItemChange
+CacheMode = QGraphicsItem.CacheMode
 
 
 class QDMGraphicsNode(QGraphicsItem):
@@ -45,12 +48,20 @@ class QDMGraphicsNode(QGraphicsItem):
         self.init_ui()
         self.was_moved = False
 
+    def itemChange(self, change: GraphicsItemChange, value):
+        if change == GraphicsItemChange.ItemPositionHasChanged:
+            self.node.update_socket_positions()
+        return super().itemChange(change, value)
+
     def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent | None) -> None:
         super().mouseMoveEvent(event)
-        # FIXME: optimize
+        # update each edge once, even if both of its nodes are moved
+        edges: set["Edge"] = set()
         for node in self.node.scene.nodes:
             if node.gr_node.isSelected():
-                node.update_connected_edges()
+                edges.update(node.get_connected_edges())
+        for edge in edges:
+            edge.update_positions()
         self.was_moved = True
     
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent | None) -> None:
@@ -79,6 +90,12 @@ class QDMGraphicsNode(QGraphicsItem):
     def init_ui(self):
         self.setFlag(GraphicsItemFlag.ItemIsSelectable)
         self.setFlag(GraphicsItemFlag.ItemIsMovable)
+        # keep cached socket positions in sync however the node is moved
+        self.setFlag(GraphicsItemFlag.ItemSendsGeometryChanges)
+        # Keep rasterized node and title, repaint only when they change
+        # https://doc.qt.io/qt-6/qgraphicsitem.html#CacheMode-enum
+        self.setCacheMode(CacheMode.DeviceCoordinateCache)
+        self.title_item.setCacheMode(CacheMode.DeviceCoordinateCache)
 
     def init_title(self):
         """
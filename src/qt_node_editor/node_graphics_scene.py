@@ -10,6 +10,8 @@ from qtpy.QtWidgets import QGraphicsScene
 if TYPE_CHECKING:
     from qt_node_editor.node_scene import Scene
 
+ItemIndexMethod = QGraphicsScene.ItemIndexMethod
+
 
 class QDMGraphicsScene(QGraphicsScene):
     def __init__(self, scene: "Scene", parent: QObject | None = None):
@@ -1,7 +1,7 @@
 import logging
 from enum import Enum, auto
 
-from qtpy.QtCore import QEvent, QPointF, Qt, Signal
+from qtpy.QtCore import QEvent, QPoint, QPointF, Qt, Signal
 from qtpy.QtGui import QKeyEvent, QMouseEvent, QPainter, QWheelEvent
 from qtpy.QtWidgets import QGraphicsItem, QGraphicsView, QWidget, QApplication
 
@@ -11,8 +11,10 @@ from qt_node_editor.node_graphics_edge import QDMGraphicsEdge
 from qt_node_editor.node_graphics_node import QDMGraphicsNode
 from qt_node_editor.node_graphics_socket import QDMGraphicsSocket
 from qt_node_editor.node_scene import Scene
+from qt_node_editor.utils import some
 
 RenderHint = QPainter.RenderHint
+OptimizationFlag = QGraphicsView.OptimizationFlag
 log = logging.getLogger(__name__)
 
 class Mode(Enum):
@@ -36,8 +38,10 @@ class QDMGraphicsView(QGraphicsView):
         self.mode = Mode.NO_OP
         self.editing_flag = False
         self.last_lmb_click_scene_pos = QPointF()
+        self.pan_last_pos: QPoint | None = None  # RMB panning
 
         self.zoom_in_factor = 1.25
+        self.zoom_out_factor = 1 / self.zoom_in_factor
         self.zoom_clamp = True
         self.zoom = 10
         self.zoom_step = 1
@@ -54,8 +58,10 @@ class QDMGraphicsView(QGraphicsView):
                             RenderHint.TextAntialiasing |
                             RenderHint.SmoothPixmapTransform)
         # https://doc.qt.io/qt-6/qgraphicsview.html#ViewportUpdateMode-enum
-        # Otherwise there are artifacts on scene background
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Repaint only changed areas, items must report correct bounding rects
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        # All items set up pen and brush in `paint`, no need to save painter state
+        self.setOptimizationFlags(OptimizationFlag.DontSavePainterState)
 
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -88,30 +94,25 @@ class QDMGraphicsView(QGraphicsView):
             super().mouseReleaseEvent(event)
 
     def right_mouse_button_press(self, event: QMouseEvent):
-        # https://doc.qt.io/qt-6/qmouseevent-obsolete.html
-        # event.modifiers - Ctrl, Shift, etc.
-        # TODO: mouseReleaseEvent is not needed?
-        release_event = QMouseEvent(QEvent.Type.MouseButtonRelease,
-                                    event.position(), event.globalPosition(),
-                                    Qt.MouseButton.RightButton,
-                                    Qt.MouseButton.NoButton, event.modifiers())
-        super().mouseReleaseEvent(release_event)
-        self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
-        fake_event = QMouseEvent(event.type(), event.position(),
-                                event.globalPosition(),
-                                Qt.MouseButton.LeftButton,
-                                event.buttons() | Qt.MouseButton.LeftButton,
-                                event.modifiers())
-        super().mousePressEvent(fake_event)
+        "Start panning the scene (like ScrollHandDrag but with RMB)."
+        self.pan_last_pos = event.position().toPoint()
+        some(self.viewport()).setCursor(Qt.CursorShape.ClosedHandCursor)
 
     def right_mouse_button_release(self, event: QMouseEvent):
-        fake_event = QMouseEvent(event.type(), event.position(),
-                                event.globalPosition(),
-                                Qt.MouseButton.LeftButton,
-                                event.buttons() & ~Qt.MouseButton.LeftButton,
-                                event.modifiers())
-        super().mouseReleaseEvent(fake_event)
-        self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+        self.pan_last_pos = None
+        some(self.viewport()).unsetCursor()
+
+    def pan(self, event: QMouseEvent):
+        "Scroll the view following the mouse."
+        if self.pan_last_pos is None:
+            raise ValueError  # right_mouse_button_press sets up pan_last_pos
+        pos = event.position().toPoint()
+        delta = pos - self.pan_last_pos
+        self.pan_last_pos = pos
+        h_bar = some(self.horizontalScrollBar())
+        h_bar.setValue(h_bar.value() - delta.x())
+        v_bar = some(self.verticalScrollBar())
+        v_bar.setValue(v_bar.value() - delta.y())
 
     def left_mouse_button_press(self, event: QMouseEvent):
         item = self.get_item_at_click(event)
@@ -164,7 +165,7 @@ class QDMGraphicsView(QGraphicsView):
 
         if self.mode == Mode.EDGE_CUT:
             self.cut_intersecting_edges()
-            self.cutline.line_points = []
+            self.cutline.clear_points()
             self.cutline.update()
             QApplication.setOverrideCursor(Qt.CursorShape.ArrowCursor)
             self.mode = Mode.NO_OP
@@ -189,13 +190,16 @@ class QDMGraphicsView(QGraphicsView):
                 for node in self._scene.nodes:
                     print(f'    {node}')
                 print('  Edges:')
-                for edge in self._scene.edges:
+                for edge in self._scene.edges.values():
                     print(f'    {edge}')
 
     def middle_mouse_button_release(self, event: QMouseEvent):
         super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self.pan_last_pos is not None:
+            self.pan(event)
+
         if self.mode == Mode.EDGE_DRAG:
             pos = self.mapToScene(event.pos())
             if not (self.drag_edge and self.drag_edge.gr_edge):
@@ -204,11 +208,10 @@ class QDMGraphicsView(QGraphicsView):
                 # Edge.remove sets gr_edge to None
                 raise ValueError
             self.drag_edge.gr_edge.set_destination(pos.x(), pos.y())
-            self.drag_edge.gr_edge.update()
 
         if self.mode == Mode.EDGE_CUT:
             pos = self.mapToScene(event.pos())
-            self.cutline.line_points.append(pos)
+            self.cutline.add_point(pos)
             self.cutline.update()
 
         self.last_scene_mouse_position = self.mapToScene(event.pos())
@@ -248,7 +251,8 @@ class QDMGraphicsView(QGraphicsView):
             p1 = self.cutline.line_points[ix]
             p2 = self.cutline.line_points[ix + 1]
 
-            for edge in self._scene.edges:
+            # copy: removed edges are popped from the dict
+            for edge in list(self._scene.edges.values()):
                 if edge.gr_edge.intersects_with(p1, p2):
                     edge.remove()
         self._scene.history.store_history("Delete cut edges")
@@ -295,7 +299,7 @@ class QDMGraphicsView(QGraphicsView):
         if isinstance(item, QDMGraphicsSocket) and \
                 item.socket is not self.last_start_socket:
             log.debug("  previous_edge=%s", self.previous_edge)
-            if item.socket.has_edge():
+            if item.socket.edge is not None:
                 item.socket.edge.remove()
             log.debug("  assign end socket %s", item.socket)
             if self.previous_edge is not None:
@@ -331,26 +335,22 @@ class QDMGraphicsView(QGraphicsView):
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         y_delta = event.angleDelta().y()
-        if y_delta > 0:
-            zoom_factor = self.zoom_in_factor
-            self.zoom += self.zoom_step
-        elif y_delta < 0:
-            zoom_out_factor = 1 / self.zoom_in_factor
-            zoom_factor = zoom_out_factor
-            self.zoom -= self.zoom_step
-        else: # horizontal scroll
+        if y_delta == 0:  # horizontal scroll
             # FIXME: not very precise when scrolling back and forth
             center = self.mapToScene(self.rect()).boundingRect().center()
             self.centerOn(center.x() - event.angleDelta().x(), center.y())
             return
 
-        clamped = False
-        if self.zoom < self.zoom_range.start:
-            self.zoom, clamped = self.zoom_range.start, True
-        elif self.zoom > self.zoom_range.stop:
-            self.zoom, clamped = self.zoom_range.stop, True
-        if not clamped or not self.zoom_clamp:
-            self.scale(zoom_factor, zoom_factor)
+        if y_delta > 0:
+            zoom_factor, zoom_step = self.zoom_in_factor, self.zoom_step
+        else:
+            zoom_factor, zoom_step = self.zoom_out_factor, -self.zoom_step
+        zoom = max(self.zoom_range.start,
+                   min(self.zoom_range.stop, self.zoom + zoom_step))
+        if zoom == self.zoom and self.zoom_clamp:
+            return  # clamped
+        self.zoom = zoom
+        self.scale(zoom_factor, zoom_factor)
 
     # @Winand
     def modify_mouse_event(self, event: QMouseEvent,
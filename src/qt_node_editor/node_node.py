@@ -11,6 +11,7 @@ from qt_node_editor.node_serializable import Serializable
 from qt_node_editor.node_socket import Pos, Socket, SocketSerialize
 
 if TYPE_CHECKING:
+    from qt_node_editor.node_edge import Edge
     from qt_node_editor.node_scene import Scene
 
 log = logging.getLogger(__name__)
@@ -26,6 +27,9 @@ class NodeSerialize(TypedDict):
 
 
 class Node(Serializable):
+    __slots__ = ("id", "_title", "scene", "content", "gr_node",
+                 "socket_spacing", "inputs", "outputs")
+
     def __init__(self, scene: "Scene", title="Undefined Node",
                  inputs: list[int] | None = None,
                  outputs: list[int] | None = None) -> None:
@@ -61,7 +65,20 @@ class Node(Serializable):
         return self.gr_node.pos()
 
     def set_pos(self, x: float, y: float):
+        "Move the node and edges connected to it."
         self.gr_node.setPos(x, y)
+        self.update_connected_edges()
+
+    def update_socket_positions(self):
+        """
+        Update cached scene positions of all sockets of the node.
+
+        Called by QDMGraphicsNode whenever the node position changes.
+        """
+        node_pos = self.gr_node.pos()
+        x, y = node_pos.x(), node_pos.y()
+        for socket in self.inputs + self.outputs:
+            socket.update_abs_pos(x, y)
 
     @property
     def title(self):
@@ -73,7 +90,7 @@ class Node(Serializable):
         self._title = value
         self.gr_node.title = value
 
-    def get_socket_position(self, index: int, position: Pos):
+    def get_socket_position(self, index: int, position: Pos) -> tuple[float, float]:
         "Get socket element x,y position by its index."
         x = 0 if position in (Pos.LEFT_TOP, Pos.LEFT_BOTTOM) else \
             self.gr_node.width
@@ -84,27 +101,26 @@ class Node(Serializable):
         else:
             y = self.gr_node.title_height + self.gr_node._padding + \
                 self.gr_node.edge_size + index * self.socket_spacing
-        return [x, y]
+        return x, y
+
+    def get_connected_edges(self) -> list["Edge"]:
+        "Edges connected to sockets of the node."
+        return [socket.edge for socket in self.inputs + self.outputs
+                if socket.edge is not None]
 
     def update_connected_edges(self):
         "Update location of edges connected to the node."
-        for socket in self.inputs + self.outputs:
-            if socket.has_edge():
-                socket.edge.update_positions()
+        for edge in self.get_connected_edges():
+            edge.update_positions()
 
     def remove(self):
         log.debug("> Removing node %s", self)
-        log.debug(" - remove all edges from sockets")
         for socket in (self.inputs + self.outputs):
             if socket.has_edge():
-                log.debug("    - removing from socket %s edge %s", socket,  socket.edge)
                 socket.edge.remove()
-        log.debug(" - remove gr_node")
         self.scene.gr_scene.removeItem(self.gr_node)
         self.gr_node = None
-        log.debug(" - remove node from the scene")
         self.scene.remove_node(self)
-        log.debug(" - everything was done.")
 
     def serialize(self) -> NodeSerialize:
         scene_pos = self.gr_node.scenePos()
@@ -120,8 +136,11 @@ class Node(Serializable):
             "content": self.content.serialize()
         }
 
-    def deserialize(self, data: NodeSerialize, hashmap: dict, restore_id=True):
+    def deserialize(self, data: NodeSerialize, hashmap: dict | None = None,
+                    restore_id=True):
         # FIXME: use some kind of a fixed structure instead of a dict?
+        if hashmap is None:
+            hashmap = {}
         if restore_id:
             self.id = data["id"]
         hashmap[self.id] = self
@@ -2,15 +2,18 @@
 Scene
 """
 import json
+from contextlib import contextmanager
 from typing import TypedDict
 
 from qt_node_editor.node_edge import Edge, EdgeSerialize
-from qt_node_editor.node_graphics_scene import QDMGraphicsScene
+from qt_node_editor.node_graphics_scene import ItemIndexMethod, QDMGraphicsScene
 from qt_node_editor.node_node import Node, NodeSerialize
 from qt_node_editor.node_scene_history import SceneHistory
 from qt_node_editor.node_serializable import Serializable
 from qt_node_editor.node_scene_clipboard import SceneClipboard
 
+MSGPACK_SUFFIX = ".msgpack"
+
 class SceneSerialize(TypedDict):
     id: int
     width: int
@@ -22,7 +25,7 @@ class Scene(Serializable):
     def __init__(self):
         super().__init__()
         self.nodes: list[Node] = []
-        self.edges: list[Edge] = []
+        self.edges: dict[int, Edge] = {}  # keyed by id(edge), ordered
 
         self.scene_width = 64000
         self.scene_height = 64000
@@ -39,13 +42,28 @@ class Scene(Serializable):
         self.nodes.append(node)
 
     def add_edge(self, edge: "Edge"):
-        self.edges.append(edge)
+        self.edges[id(edge)] = edge
 
     def remove_node(self, node: "Node"):
         self.nodes.remove(node)
 
-    def remove_edge(self, edge: "Edge"):
-        self.edges.remove(edge)
+    def remove_edge(self, edge: "Edge") -> bool:
+        "Remove edge from the scene. Returns False if edge is not in the scene."
+        return self.edges.pop(id(edge), None) is not None
+
+    @contextmanager
+    def bulk_update(self):
+        """
+        Disable item indexing while many items are added or removed.
+
+        The index is rebuilt once on exit instead of on every addItem/removeItem.
+        """
+        index_method = self.gr_scene.itemIndexMethod()
+        self.gr_scene.setItemIndexMethod(ItemIndexMethod.NoIndex)
+        try:
+            yield
+        finally:
+            self.gr_scene.setItemIndexMethod(index_method)
 
     def clear(self):
         "Clear the scene."
@@ -53,20 +71,30 @@ class Scene(Serializable):
             self.nodes[0].remove()
 
     def save_to_file(self, filename: str):
-        "Save the scene to file."
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(json.dumps(self.serialize(), indent=4))
+        "Save the scene to file (MessagePack if extension is .msgpack, else JSON)."
+        if filename.endswith(MSGPACK_SUFFIX):
+            import msgpack  # type: ignore[import-untyped]  # optional dependency
+            with open(filename, "wb") as file:
+                file.write(msgpack.packb(self.serialize(), use_bin_type=True))
+        else:
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write(json.dumps(self.serialize(), indent=4))
         print(f"Saving to {filename} was successfull")
     
     def load_from_file(self, filename: str):
-        "Load scene from file."
-        with open(filename, "r", encoding="utf-8") as file:
-            data = json.load(file)
-            self.deserialize(data)
+        "Load scene from file (MessagePack if extension is .msgpack, else JSON)."
+        if filename.endswith(MSGPACK_SUFFIX):
+            import msgpack  # type: ignore[import-untyped]  # optional dependency
+            with open(filename, "rb") as file:
+                data = msgpack.unpackb(file.read(), raw=False)
+        else:
+            with open(filename, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        self.deserialize(data)
 
     def serialize(self) -> SceneSerialize:
         nodes = [n.serialize() for n in self.nodes]
-        edges = [e.serialize() for e in self.edges]
+        edges = [e.serialize() for e in self.edges.values()]
         return {  # dicts are ordered in Python 3.7+
             "id": self.id,
             "width": self.scene_width,
@@ -77,15 +105,16 @@ class Scene(Serializable):
 
     def deserialize(self, data: SceneSerialize, hashmap: dict | None = None,
                     restore_id=True):
-        self.clear()
-        hashmap = {}
-        if restore_id:  # avoid id collisions when copying items
-            self.id = data["id"]
+        with self.bulk_update():
+            self.clear()
+            hashmap = {}
+            if restore_id:  # avoid id collisions when copying items
+                self.id = data["id"]
 
-        for node_data in data["nodes"]:
-            Node(self).deserialize(node_data, hashmap, restore_id)
+            for node_data in data["nodes"]:
+                Node(self).deserialize(node_data, hashmap, restore_id)
 
-        for edge_data in data["edges"]:
-            Edge(self).deserialize(edge_data, hashmap, restore_id)
+            for edge_data in data["edges"]:
+                Edge(self).deserialize(edge_data, hashmap, restore_id)
 
         return True
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, TypedDict
 
 from qt_node_editor.node_graphics_edge import QDMGraphicsEdge
 from qt_node_editor.node_graphics_node import QDMGraphicsNode
+from qt_node_editor.utils import some
 
 if TYPE_CHECKING:
     from qt_node_editor.node_scene import Scene, SceneSerialize
@@ -91,9 +92,9 @@ class SceneHistory:
         self.scene.deserialize(history_stamp['snapshot'])
 
         for edge_id in history_stamp['selection']['edges']:
-            for edge in self.scene.edges:
+            for edge in self.scene.edges.values():
                 if edge.id == edge_id:
-                    edge.gr_edge.setSelected(True)
+                    some(edge.gr_edge).setSelected(True)
                     break
 
         for node_id in history_stamp['selection']['nodes']:
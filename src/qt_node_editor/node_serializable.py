@@ -1,9 +1,14 @@
 class Serializable:
+    # Empty: Serializable is also mixed into QWidget (QDMContentWidget), where
+    # a non-empty slot layout conflicts with the sip wrapper. Subclasses
+    # with __slots__ must declare `id` themselves.
+    __slots__ = ()
+
     def __init__(self) -> None:
-        self.id = id(self)
+        self.id = id(self)  # type: ignore[misc]  # slot or __dict__ of subclass
     
     def serialize(self):
         raise NotImplementedError()
     
-    def deserialize(self, data, hashmap: dict={}):
+    def deserialize(self, data, hashmap: dict | None = None):
         raise NotImplementedError()
@@ -36,15 +36,25 @@ class Socket(Serializable):
         self.socket_type = socket_type
 
         self.gr_socket = QDMGraphicsSocket(self, socket_type)
-        self.gr_socket.setPos(*self.node.get_socket_position(index, position))
+        self.rel_pos = self.node.get_socket_position(index, position)
+        self.gr_socket.setPos(*self.rel_pos)
+        # position in a scene, see update_abs_pos
+        self.abs_pos: tuple[float, float] = (0.0, 0.0)
+        node_pos = self.node.gr_node.pos()
+        self.update_abs_pos(node_pos.x(), node_pos.y())
 
-        self.edge = None
+        self.edge: "Edge | None" = None
 
     def __str__(self):
         return f"<Socket ..{hex(id(self))[-5:]} '{self.node.title}'>"
 
     def get_socket_position(self):
-        return self.node.get_socket_position(self.index, self.position)
+        return self.rel_pos
+
+    def update_abs_pos(self, node_x: float, node_y: float):
+        "Update cached scene position of the socket when its node moves."
+        x, y = self.rel_pos
+        self.abs_pos = (node_x + x, node_y + y)
 
     def set_connected_edge(self, edge: "Edge"):
         self.edge = edge
@@ -61,8 +71,10 @@ class Socket(Serializable):
             "socket_type": self.socket_type
         }
 
-    def deserialize(self, data: SocketSerialize, hashmap: dict = {},
+    def deserialize(self, data: SocketSerialize, hashmap: dict | None = None,
                     restore_id=True):
+        if hashmap is None:
+            hashmap = {}
         if restore_id:
             self.id = data["id"]
         hashmap[self.id] = self
@@ -0,0 +1,71 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtWidgets import QApplication
+
+from qt_node_editor.node_edge import Edge, EdgeType
+from qt_node_editor.node_node import Node
+from qt_node_editor.node_scene import Scene
+
+
+def setUpModule():
+    global app
+    app = QApplication.instance() or QApplication([])
+
+
+class EdgeSerializeTest(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.node1 = Node(self.scene, "Node 1", inputs=[0], outputs=[1, 1])
+        self.node2 = Node(self.scene, "Node 2", inputs=[1, 1], outputs=[1])
+        self.edge = Edge(self.scene, self.node1.outputs[0],
+                         self.node2.inputs[0])
+
+    def test_serialize(self):
+        self.assertEqual(self.edge.serialize(), {
+            "id": self.edge.id,
+            "edge_type": EdgeType.DIRECT,
+            "start": self.node1.outputs[0].id,
+            "end": self.node2.inputs[0].id,
+        })
+
+    def test_result_is_not_shared(self):
+        data = self.edge.serialize()
+        data["start"] = None
+        self.assertEqual(self.edge.serialize()["start"],
+                         self.node1.outputs[0].id)
+
+    def test_start_socket_change(self):
+        self.edge.serialize()
+        self.edge.start_socket = self.node1.outputs[1]
+        self.assertEqual(self.edge.serialize()["start"],
+                         self.node1.outputs[1].id)
+
+    def test_end_socket_change(self):
+        self.edge.serialize()
+        self.edge.end_socket = self.node2.inputs[1]
+        self.assertEqual(self.edge.serialize()["end"],
+                         self.node2.inputs[1].id)
+
+    def test_edge_type_change(self):
+        self.edge.serialize()
+        self.edge.edge_type = EdgeType.BEZIER
+        self.assertEqual(self.edge.serialize()["edge_type"], EdgeType.BEZIER)
+
+    def test_id_change(self):
+        self.edge.serialize()
+        self.edge.id = 12345
+        self.assertEqual(self.edge.serialize()["id"], 12345)
+
+    def test_disconnect(self):
+        self.edge.serialize()
+        self.edge.disconnect_from_sockets()
+        data = self.edge.serialize()
+        self.assertIsNone(data["start"])
+        self.assertIsNone(data["end"])
+
+
+if __name__ == "__main__":
+    unittest.main()
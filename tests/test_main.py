@@ -0,0 +1,51 @@
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from qt_node_editor.main import configure_logging
+
+
+class ConfigureLoggingTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        Path("conf").mkdir()
+        configure_logging.cache_clear()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+        configure_logging.cache_clear()
+        for name in ("test.string_level", "test.int_level"):
+            logging.getLogger(name).setLevel(logging.NOTSET)
+
+    def write_config(self, text: str):
+        Path("conf/logging_config.toml").write_text(text, encoding="utf-8")
+
+    def test_levels(self):
+        self.write_config('[levels]\n'
+                          '"test.string_level" = "warning"\n'
+                          '"test.int_level" = 40\n')
+        configure_logging(False)
+        self.assertEqual(logging.getLogger("test.string_level").level,
+                         logging.WARNING)
+        self.assertEqual(logging.getLogger("test.int_level").level,
+                         logging.ERROR)
+
+    def test_missing_config(self):
+        configure_logging(False)  # does not raise
+
+    def test_invalid_config(self):
+        # INI-style config from the old template
+        self.write_config('[levels]\n'
+                          'qt_node_editor.node_node = info\n')
+        with self.assertLogs("qt_node_editor.main", logging.WARNING) as cm:
+            configure_logging(False)
+        self.assertIn("conf/logging_config.toml", cm.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
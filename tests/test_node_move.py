@@ -0,0 +1,91 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtCore import QPointF, Qt
+from qtpy.QtTest import QTest
+from qtpy.QtWidgets import QApplication
+
+from qt_node_editor.node_edge import Edge
+from qt_node_editor.node_graphics_view import QDMGraphicsView
+from qt_node_editor.node_node import Node
+from qt_node_editor.node_scene import Scene
+
+
+def setUpModule():
+    global app
+    app = QApplication.instance() or QApplication([])
+
+
+class NodeMoveTest(unittest.TestCase):
+    "Edges follow moved nodes without running the event loop."
+
+    def setUp(self):
+        self.scene = Scene()
+        self.node1 = Node(self.scene, "Node 1", inputs=[0], outputs=[1])
+        self.node2 = Node(self.scene, "Node 2", inputs=[1], outputs=[1])
+        self.node2.set_pos(300, 0)
+        self.edge = Edge(self.scene, self.node1.outputs[0],
+                         self.node2.inputs[0])
+        self.view = QDMGraphicsView(self.scene, None)
+        self.view.resize(800, 600)
+        self.view.show()
+
+    def tearDown(self):
+        self.view.close()
+
+    def assert_edge_at_sockets(self):
+        start, end = self.edge.start_socket, self.edge.end_socket
+        assert start is not None and end is not None
+        node_pos = start.node.pos
+        x, y = start.get_socket_position()
+        self.assertEqual(start.abs_pos, (node_pos.x() + x, node_pos.y() + y))
+        node_pos = end.node.pos
+        x, y = end.get_socket_position()
+        self.assertEqual(end.abs_pos, (node_pos.x() + x, node_pos.y() + y))
+
+        gr_edge = self.edge.gr_edge
+        assert gr_edge is not None
+        self.assertEqual(tuple(gr_edge.pos_source), start.abs_pos)
+        self.assertEqual(tuple(gr_edge.pos_destination), end.abs_pos)
+
+    def drag(self, node: Node, dx: int, dy: int, steps=3):
+        "Drag node by its title with the left mouse button."
+        viewport = self.view.viewport()
+        start = self.view.mapFromScene(node.pos + QPointF(50, 10))
+        QTest.mousePress(viewport, Qt.MouseButton.LeftButton, pos=start)
+        for i in range(1, steps + 1):
+            pos = start + QPointF(dx * i / steps, dy * i / steps).toPoint()
+            QTest.mouseMove(viewport, pos)
+            self.assert_edge_at_sockets()  # no lag behind the node
+        QTest.mouseRelease(viewport, Qt.MouseButton.LeftButton, pos=pos)
+
+    def test_set_pos(self):
+        self.node1.set_pos(-120, 45)
+        self.assert_edge_at_sockets()
+        self.node2.set_pos(200, -80)
+        self.assert_edge_at_sockets()
+
+    def test_graphics_item_move(self):
+        "Socket positions follow the node moved by other means."
+        self.node1.gr_node.moveBy(25, -15)
+        self.edge.update_positions()
+        self.assert_edge_at_sockets()
+
+    def test_drag(self):
+        self.drag(self.node1, 60, 40)
+        self.assertNotEqual((self.node1.pos.x(), self.node1.pos.y()), (0, 0))
+        self.assert_edge_at_sockets()
+
+    def test_drag_selected_nodes(self):
+        self.node1.gr_node.setSelected(True)
+        self.node2.gr_node.setSelected(True)
+        before = self.node2.pos
+        self.drag(self.node1, -30, 50)
+        self.assertNotEqual(self.node2.pos, before)
+        self.assert_edge_at_sockets()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtWidgets import QApplication
+
+from qt_node_editor.node_edge import Edge, EdgeType
+from qt_node_editor.node_node import Node
+from qt_node_editor.node_scene import Scene
+
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+
+
+def setUpModule():
+    global app
+    app = QApplication.instance() or QApplication([])
+
+
+def make_scene() -> Scene:
+    scene = Scene()
+    node1 = Node(scene, "Node 1", inputs=[0], outputs=[1])
+    node2 = Node(scene, "Node 2", inputs=[1, 2], outputs=[1])
+    node1.set_pos(-100, -50)
+    node2.set_pos(150, 25)
+    Edge(scene, node1.outputs[0], node2.inputs[1], shape=EdgeType.BEZIER)
+    return scene
+
+
+class SceneFileTest(unittest.TestCase):
+    def round_trip(self, suffix: str):
+        scene = make_scene()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = str(Path(tmp_dir, "scene" + suffix))
+            scene.save_to_file(filename)
+            loaded = Scene()
+            loaded.load_from_file(filename)
+        self.assertEqual(loaded.serialize(), scene.serialize())
+        self.assertEqual(len(loaded.nodes), 2)
+        self.assertEqual(len(loaded.edges), 1)
+
+    def test_json_round_trip(self):
+        self.round_trip(".json")
+
+    @unittest.skipUnless(HAS_MSGPACK, "msgpack is not installed")
+    def test_msgpack_round_trip(self):
+        self.round_trip(".msgpack")
+
+
+if __name__ == "__main__":
+    unittest.main()